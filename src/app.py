@@ -5,91 +5,170 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Header
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse, Response
+from typing import Any, Optional
+import hashlib
+import orjson
 import os
+import re
 from pathlib import Path
 
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class CachedStaticFiles(StaticFiles):
+    """Static files with Cache-Control headers
+
+    Fingerprinted assets (e.g. ``app.3f9a1c2b.js``) never change under the
+    same name, so they are cached for a year. Everything else, including
+    index.html, must be revalidated, which the ETag/Last-Modified headers
+    Starlette already sets turn into cheap 304 responses.
+    """
+
+    FINGERPRINTED = re.compile(r"\.[0-9a-f]{8,}\.[^./]+$")
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope,
+                                         status_code)
+        if self.FINGERPRINTED.search(str(full_path)):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response.headers["Cache-Control"] = "no-cache"
+        return response
+
+
 app = FastAPI(title="Mergington High School API",
-              description="API for viewing and signing up for extracurricular activities")
+              description="API for viewing and signing up for extracurricular activities",
+              default_response_class=ORJSONResponse)
 
 # Mount the static files directory
 current_dir = Path(__file__).parent
-app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
+app.mount("/static", CachedStaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
-# In-memory activity database
+# In-memory activity database (participants are sets for O(1) membership)
 activities = {
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     },
     "Soccer Team": {
         "description": "Join the school soccer team and compete in matches",
         "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
         "max_participants": 22,
-        "participants": ["liam@mergington.edu", "noah@mergington.edu"]
+        "participants": {"liam@mergington.edu", "noah@mergington.edu"}
     },
     "Basketball Team": {
         "description": "Practice and play basketball with the school team",
         "schedule": "Wednesdays and Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 15,
-        "participants": ["ava@mergington.edu", "mia@mergington.edu"]
+        "participants": {"ava@mergington.edu", "mia@mergington.edu"}
     },
     "Art Club": {
         "description": "Explore your creativity through painting and drawing",
         "schedule": "Thursdays, 3:30 PM - 5:00 PM",
         "max_participants": 15,
-        "participants": ["amelia@mergington.edu", "harper@mergington.edu"]
+        "participants": {"amelia@mergington.edu", "harper@mergington.edu"}
     },
     "Drama Club": {
         "description": "Act, direct, and produce plays and performances",
         "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
         "max_participants": 20,
-        "participants": ["ella@mergington.edu", "scarlett@mergington.edu"]
+        "participants": {"ella@mergington.edu", "scarlett@mergington.edu"}
     },
     "Math Club": {
         "description": "Solve challenging problems and participate in math competitions",
         "schedule": "Tuesdays, 3:30 PM - 4:30 PM",
         "max_participants": 10,
-        "participants": ["james@mergington.edu", "benjamin@mergington.edu"]
+        "participants": {"james@mergington.edu", "benjamin@mergington.edu"}
     },
     "Debate Team": {
         "description": "Develop public speaking and argumentation skills",
         "schedule": "Fridays, 4:00 PM - 5:30 PM",
         "max_participants": 12,
-        "participants": ["charlotte@mergington.edu", "henry@mergington.edu"]
+        "participants": {"charlotte@mergington.edu", "henry@mergington.edu"}
     }
 }
 
 
+def activities_view():
+    """Return a JSON-serializable copy of activities with sorted participant lists"""
+    return {
+        name: {**details, "participants": sorted(details["participants"])}
+        for name, details in activities.items()
+    }
+
+
+# Serialized /activities payload and its ETag, rebuilt lazily after mutations
+_activities_cache: Optional[bytes] = None
+_activities_etag: Optional[str] = None
+
+
+def invalidate_activities_cache():
+    """Drop the cached /activities payload so the next request rebuilds it"""
+    global _activities_cache, _activities_etag
+    _activities_cache = None
+    _activities_etag = None
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak If-None-Match comparison: handles lists, W/ prefixes and *"""
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
 @app.get("/")
-def root():
+async def root():
     return RedirectResponse(url="/static/index.html")
 
 
 @app.get("/activities")
-def get_activities():
-    return activities
+async def get_activities(if_none_match: Optional[str] = Header(None)):
+    global _activities_cache, _activities_etag
+    if _activities_cache is None:
+        _activities_cache = orjson.dumps(activities_view())
+        _activities_etag = '"{}"'.format(
+            hashlib.blake2b(_activities_cache, digest_size=8).hexdigest())
+
+    headers = {"ETag": _activities_etag}
+    if etag_matches(if_none_match, _activities_etag):
+        return Response(status_code=304, headers=headers)
+    return Response(_activities_cache, media_type="application/json",
+                    headers=headers)
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+async def signup_for_activity(activity_name: str, email: str):
     """Sign up a student for an activity"""
     # Validate activity exists
     if activity_name not in activities:
@@ -106,12 +185,13 @@ def signup_for_activity(activity_name: str, email: str):
         )
 
     # Add student
-    activity["participants"].append(email)
+    activity["participants"].add(email)
+    invalidate_activities_cache()
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
 @app.delete("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
+async def unregister_from_activity(activity_name: str, email: str):
     """Unregister a student from an activity"""
     # Validate activity exists
     if activity_name not in activities:
@@ -128,5 +208,14 @@ def unregister_from_activity(activity_name: str, email: str):
         )
 
     # Remove student
-    activity["participants"].remove(email)
+    activity["participants"].discard(email)
+    invalidate_activities_cache()
     return {"message": f"Unregistered {email} from {activity_name}"}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # A single worker: activities live in process memory, so forked workers
+    # would each hold their own diverging copy.
+    uvicorn.run(app, host="0.0.0.0", port=8000)